@@ -2,12 +2,45 @@ import json
 import re
 import math
 import os
-import glob
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    # orjson decodes large boletines several times faster than the stdlib
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 # ==========================================
 # 1. SPANISH TEXT TO NUMBER CONVERTER
 # ==========================================
+_RE_CURRENCY_STRIP = re.compile(r'DÓLARES|DOLARES|COLONES|EXACTOS|CENTAVOS|CÉNTIMOS')
+_RE_BASE_DE = re.compile(r'base de (.*?) (COLONES|DÓLARES|DOLARES)', re.IGNORECASE)
+_RE_CON_CENTAVOS = re.compile(r'CON (.*?) (CENTAVOS|CÉNTIMOS)', re.IGNORECASE)
+
+# Mapping words to values
+# Note: This is a simplified parser. For full production robustness, 
+# specific libraries exist, but this handles the common legal format.
+_VALUES = {
+    'UN': 1, 'UNO': 1, 'UNA': 1,   'DOS': 2, 'TRES': 3, 'CUATRO': 4, 'CINCO': 5,
+    'SEIS': 6, 'SIETE': 7, 'OCHO': 8, 'NUEVE': 9, 'DIEZ': 10,
+    'ONCE': 11, 'DOCE': 12, 'TRECE': 13, 'CATORCE': 14, 'QUINCE': 15,
+    'DIECISEIS': 16, 'DIECISÉIS': 16, 'DIECISIETE': 17, 'DIECIOCHO': 18, 'DIECINUEVE': 19,
+    'VEINTE': 20, 'VEINTI': 20, 'VEINTIUN': 21, 'VEINTIÚN': 21, 'VEINTIDOS': 22, 'VEINTIDÓS': 22,
+    'VEINTITRES': 23, 'VEINTITRÉS': 23, 'VEINTICUATRO': 24, 'VEINTICINCO': 25, 'VEINTISEIS': 26, 'VEINTISÉIS': 26,
+    'VEINTISIETE': 27, 'VEINTIOCHO': 28, 'VEINTINUEVE': 29,
+    'TREINTA': 30, 'CUARENTA': 40, 'CINCUENTA': 50, 'SESENTA': 60, 'SETENTA': 70, 'OCHENTA': 80, 'NOVENTA': 90,
+    'CIEN': 100, 'CIENTO': 100, 'DOSCIENTOS': 200, 'TRESCIENTOS': 300, 'CUATROCIENTOS': 400, 'QUINIENTOS': 500,
+    'SEISCIENTOS': 600, 'SETECIENTOS': 700, 'OCHOCIENTOS': 800, 'NOVECIENTOS': 900,
+    'MIL': 1000, 'MILLON': 1000000, 'MILLONES': 1000000
+}
+
+# Whitespace-delimited tokens only, same as splitting the text on whitespace
+_TOKEN_RE = re.compile(r'(?<!\S)(?:' + '|'.join(sorted(_VALUES, key=len, reverse=True)) + r')(?!\S)')
+
+# Amount phrases repeat a lot across entries (cents, multi-lot bases)
+@lru_cache(maxsize=4096)
 def text_to_number(text):
     """
     Parses a Spanish phrase representing a number/currency and returns a float.
@@ -15,7 +48,9 @@ def text_to_number(text):
       "OCHO MIL CIENTO VEINTISIETE DÓLARES CON VEINTIÚN CENTAVOS"
       "SIETE MILLONES DE COLONES"
     """
-    text = text.upper().replace(" Y ", " ").replace(" CON ", " ")
+    # Legal amounts usually arrive uppercase already; skip the copy then
+    if not text.isupper():
+        text = text.upper()
     
     # Currency detection
     currency = "CRC"
@@ -23,42 +58,19 @@ def text_to_number(text):
         currency = "USD"
     
     # Remove currency words to parse just the number
-    text = re.sub(r'DÓLARES|DOLARES|COLONES|EXACTOS|CENTAVOS|CÉNTIMOS', '', text).strip()
-
-    # Mapping words to values
-    # Note: This is a simplified parser. For full production robustness, 
-    # specific libraries exist, but this handles the common legal format.
-    values = {
-        'UN': 1, 'UNO': 1, 'UNA': 1,   'DOS': 2, 'TRES': 3, 'CUATRO': 4, 'CINCO': 5,
-        'SEIS': 6, 'SIETE': 7, 'OCHO': 8, 'NUEVE': 9, 'DIEZ': 10,
-        'ONCE': 11, 'DOCE': 12, 'TRECE': 13, 'CATORCE': 14, 'QUINCE': 15,
-        'DIECISEIS': 16, 'DIECISÉIS': 16, 'DIECISIETE': 17, 'DIECIOCHO': 18, 'DIECINUEVE': 19,
-        'VEINTE': 20, 'VEINTI': 20, 'VEINTIUN': 21, 'VEINTIÚN': 21, 'VEINTIDOS': 22, 'VEINTIDÓS': 22,
-        'VEINTITRES': 23, 'VEINTITRÉS': 23, 'VEINTICUATRO': 24, 'VEINTICINCO': 25, 'VEINTISEIS': 26, 'VEINTISÉIS': 26,
-        'VEINTISIETE': 27, 'VEINTIOCHO': 28, 'VEINTINUEVE': 29,
-        'TREINTA': 30, 'CUARENTA': 40, 'CINCUENTA': 50, 'SESENTA': 60, 'SETENTA': 70, 'OCHENTA': 80, 'NOVENTA': 90,
-        'CIEN': 100, 'CIENTO': 100, 'DOSCIENTOS': 200, 'TRESCIENTOS': 300, 'CUATROCIENTOS': 400, 'QUINIENTOS': 500,
-        'SEISCIENTOS': 600, 'SETECIENTOS': 700, 'OCHOCIENTOS': 800, 'NOVECIENTOS': 900,
-        'MIL': 1000, 'MILLON': 1000000, 'MILLONES': 1000000
-    }
+    # ("Y" / "CON" need no pass of their own: they are not number words,
+    # so the tokenizer below already skips them)
+    text = _RE_CURRENCY_STRIP.sub('', text)
 
-    # Tokenize
-    tokens = text.split()
     total_value = 0
     current_value = 0
     
-    for token in tokens:
-        val = values.get(token, 0)
+    for m in _TOKEN_RE.finditer(text):
+        val = _VALUES[m.group(0)]
         
-        if val == 1000:
-            if current_value == 0: current_value = 1
-            current_value *= 1000
-            total_value += current_value
-            current_value = 0
-        elif val >= 1000000:
-            if current_value == 0: current_value = 1
-            current_value *= val
-            total_value += current_value
+        # MIL / MILLON(ES) close the current group as a multiplier
+        if val >= 1000:
+            total_value += (current_value or 1) * val
             current_value = 0
         else:
             current_value += val
@@ -66,23 +78,25 @@ def text_to_number(text):
     total_value += current_value
     
     # Handle cents (roughly) - in legal text usually follows "CON XX CENTAVOS"
-    # Since we cleaned "CON" and "CENTAVOS", the cents remain at the end of the text stream 
-    # but the logic above adds them as integers.
-    # To fix this properly without a complex parser, let's look for the original "CON" split
-    # This is a heuristic.
+    # "CENTAVOS" was stripped and "CON" is skipped by the tokenizer, so the
+    # cents words are still in the text and the logic above adds them as
+    # integers. extract_price_and_currency_robust parses the "CON ... CENTAVOS"
+    # clause on its own instead. This is a heuristic.
     
     return total_value, currency
 
-def extract_price_and_currency_robust(text_segment):
+def extract_price_and_currency_robust(text_segment, limit=None):
     """
     Extracts number and currency from a specific segment like "base de X... (75%...)"
+    If `limit` is given, only the first `limit` characters are searched.
     """
+    endpos = len(text_segment) if limit is None else limit
     # Simply looking for the text before "COLONES" or "DÓLARES"
-    match = re.search(r'base de (.*?) (COLONES|DÓLARES|DOLARES)', text_segment, re.IGNORECASE)
+    match = _RE_BASE_DE.search(text_segment, 0, endpos)
     if match:
         amount_text = match.group(1)
         # Parse cents if explicitly mentioned to division logic
-        cents_match = re.search(r'CON (.*?) (CENTAVOS|CÉNTIMOS)', text_segment, re.IGNORECASE)
+        cents_match = _RE_CON_CENTAVOS.search(text_segment, 0, endpos)
         
         val, curr = text_to_number(amount_text + (" " + match.group(2)))
         
@@ -98,13 +112,52 @@ def extract_price_and_currency_robust(text_segment):
 # ==========================================
 # 2. PARSING LOGIC
 # ==========================================
+# Compiled once at import; parse_auction_entry runs once per JSON entry.
+# Keyword and location patterns are lowercase and run against content.lower().
+_RE_PROP_KW = re.compile(r'\bfinca\b|\bterreno\b|\blote\b|\bpropiedad\b')
+_RE_VEHICLE_KW = re.compile(r'\bvehículo\b|\bcarro\b|\bmoto\b|\bchasis\b')
+
+_RE_DATE1 = re.compile(r'señalan las .*? del (.*?) de (dos mil .*?)\.')
+_RE_2ND = re.compile(r'segundo remate se efectuará (.*?) \(75%')
+_RE_2ND_DATE = re.compile(r'a las .*? dos mil .*? con')
+_RE_2ND_BASE = re.compile(r'base de (.*)')
+_RE_3RD = re.compile(r'tercer remate se señalan (.*?) \(25%')
+_RE_3RD_DATE = re.compile(r' las .*? dos mil .*? con')
+
+_RE_MIDE = re.compile(r'MIDE: (.*?)(\.|PLANO)')
+_RE_LOC = re.compile(r'situada en (.*?)(, de la provincia|\.)')
+_RE_NATURALEZA = re.compile(r'es (.*?) Situada')
+_RE_COLINDA = re.compile(r'COLINDA: (.*?) MIDE')
+
+_RE_MARCA = re.compile(r'Marca:? (.*?)(,|\.)')
+_RE_ESTILO = re.compile(r'Estilo:? (.*?)(,|\.)')
+_RE_ANIO = re.compile(r'Año:? (.*?)(,|\.)')
+_RE_PLACA = re.compile(r'(Placa|placas) (.*?)(,)')
+_RE_MOTOR = re.compile(r'Motor:? (.*?)(,|\.)')
+
+_RE_EXP = re.compile(r'EXP:(.*?)(JUZGADO| )')
+_RE_JUZGADO = re.compile(r'JUZGADO (.*?)( \.| $)')
+_RE_DEMANDANTE = re.compile(r' de (.*?) contra ')
+_RE_DEMANDADO = re.compile(r' contra (.*?) EXP')
+
+def _search_from(pattern, text, keyword):
+    """
+    Runs `pattern`, which starts with the literal `keyword`, from the first
+    occurrence of that keyword; returns None without scanning if it is absent.
+    """
+    pos = text.find(keyword)
+    return pattern.search(text, pos) if pos >= 0 else None
 
 def parse_auction_entry(entry):
     content = entry['contenido']
+    # Lowercased once for the case-insensitive searches. 'İ' is the only
+    # character whose lowercase is longer, so mapping it first keeps the
+    # spans valid on the original text.
+    content_lower = content.replace("İ", "I").lower()
     
     # -- 1. Determine Type --
     # Property keywords
-    if re.search(r'\bfinca\b|\bterreno\b|\blote\b|\bpropiedad\b', content, re.IGNORECASE) and not re.search(r'\bvehículo\b|\bcarro\b|\bmoto\b|\bchasis\b', content, re.IGNORECASE):
+    if _RE_PROP_KW.search(content_lower) and not _RE_VEHICLE_KW.search(content_lower):
         item_type = 'propiedad'
     else:
         item_type = 'vehiculo'
@@ -118,10 +171,10 @@ def parse_auction_entry(entry):
     remates = []
     
     # Base Price (1st Auction)
-    price1, currency = extract_price_and_currency_robust(content[:300]) # Look near start
+    price1, currency = extract_price_and_currency_robust(content, 300) # Look near start
     
     # Date 1st Auction
-    date1_match = re.search(r'señalan las .*? del (.*?) de (dos mil .*?)\.', content)
+    date1_match = _RE_DATE1.search(content)
     date1 = date1_match.group(0).replace("señalan las ", "") if date1_match else "No indicado"
 
     remates.append({
@@ -132,15 +185,15 @@ def parse_auction_entry(entry):
     })
     
     # 2nd Auction
-    match_2nd = re.search(r'segundo remate se efectuará (.*?) \(75%', content)
+    match_2nd = _RE_2ND.search(content)
     if match_2nd:
         seg_text = match_2nd.group(1)
         # Extract date
-        d2 = re.search(r'a las .*? dos mil .*? con', seg_text)
+        d2 = _RE_2ND_DATE.search(seg_text)
         date2 = d2.group(0).replace("a las ", "").replace("con", "") if d2 else "No indicado"
         
         # Extract price
-        p2_text = re.search(r'base de (.*)', seg_text)
+        p2_text = _RE_2ND_BASE.search(seg_text)
         price2 = 0
         if p2_text:
             p2, _ = text_to_number(p2_text.group(1))
@@ -157,11 +210,11 @@ def parse_auction_entry(entry):
         })
         
     # 3rd Auction
-    match_3rd = re.search(r'tercer remate se señalan (.*?) \(25%', content)
+    match_3rd = _RE_3RD.search(content)
     if match_3rd:
         ter_text = match_3rd.group(1)
         # Extract date
-        d3 = re.search(r' las .*? dos mil .*? con', ter_text)
+        d3 = _RE_3RD_DATE.search(ter_text)
         date3 = d3.group(0).replace(" las ", "").replace("con", "") if d3 else "No indicado"
         
         # Price
@@ -175,6 +228,9 @@ def parse_auction_entry(entry):
         })
 
     # -- 3. Title & Specs --
+    # Each field regex is skipped when its literal keyword is absent; a plain
+    # substring check is far cheaper than a failing regex scan. Patterns that
+    # start with their keyword also begin scanning at its first occurrence.
     title = ""
     area = "--"
     
@@ -182,35 +238,35 @@ def parse_auction_entry(entry):
     
     if item_type == 'propiedad':
         # Area
-        area_match = re.search(r'MIDE: (.*?)(\.|PLANO)', content)
+        area_match = _search_from(_RE_MIDE, content, 'MIDE: ')
         if area_match:
             area_text = area_match.group(1)
             # Try to extract numbers
             # Usually in words "CIENTO CINCUENTA..."
             # For title display, let's try to parse or just truncate
             # If we want numeric area for sorting/display:
-            try:
-                area_val, _ = text_to_number(area_text)
-                area = f"{int(area_val)} m²"
-            except:
-                area = "Ver detalle"
+            area_val, _ = text_to_number(area_text)
+            area = f"{int(area_val)} m²" if area_val else "Ver detalle"
         
         # Location (Title)
-        loc_match = re.search(r'Situada en (.*?)(, de la provincia|\.)', content, re.IGNORECASE)
+        loc_match = _RE_LOC.search(content_lower) if 'situada en' in content_lower else None
         if loc_match:
-            title = loc_match.group(1).strip()
+            # Take the original-case text
+            title = content[loc_match.start(1):loc_match.end(1)].strip()
         else:
             title = "Propiedad Sin Ubicación Identificada"
             
         # Extract Details for box
-        details['Naturaleza'] = re.search(r'es (.*?) Situada', content).group(1) if re.search(r'es (.*?) Situada', content) else ""
-        details['Colindantes'] = re.search(r'COLINDA: (.*?) MIDE', content).group(1) if re.search(r'COLINDA: (.*?) MIDE', content) else ""
+        naturaleza = _RE_NATURALEZA.search(content) if 'Situada' in content else None
+        details['Naturaleza'] = naturaleza.group(1) if naturaleza else ""
+        colinda = _search_from(_RE_COLINDA, content, 'COLINDA: ')
+        details['Colindantes'] = colinda.group(1) if colinda else ""
         
     else:
         # Vehicle Title
-        marca = re.search(r'Marca:? (.*?)(,|\.)', content)
-        estilo = re.search(r'Estilo:? (.*?)(,|\.)', content)
-        anio = re.search(r'Año:? (.*?)(,|\.)', content)
+        marca = _search_from(_RE_MARCA, content, 'Marca')
+        estilo = _search_from(_RE_ESTILO, content, 'Estilo')
+        anio = _search_from(_RE_ANIO, content, 'Año')
         
         m_str = marca.group(1) if marca else "Vehículo"
         e_str = estilo.group(1) if estilo else ""
@@ -219,14 +275,20 @@ def parse_auction_entry(entry):
         title = f"{m_str} {e_str} {a_str}".strip()
         
         # Details
-        details['Placa'] = re.search(r'(Placa|placas) (.*?)(,)', content).group(2) if re.search(r'(Placa|placas) (.*?)(,)', content) else ""
-        details['Motor'] = re.search(r'Motor:? (.*?)(,|\.)', content).group(1) if re.search(r'Motor:? (.*?)(,|\.)', content) else ""
+        placa = _RE_PLACA.search(content) if 'Placa' in content or 'placas' in content else None
+        details['Placa'] = placa.group(2) if placa else ""
+        motor = _search_from(_RE_MOTOR, content, 'Motor')
+        details['Motor'] = motor.group(1) if motor else ""
         
     # Legal Info Common
-    details['Expediente'] = re.search(r'EXP:(.*?)(JUZGADO| )', content).group(1) if re.search(r'EXP:(.*?)(JUZGADO| )', content) else ""
-    details['Juzgado'] = re.search(r'JUZGADO (.*?)( \.| $)', content).group(1) if re.search(r'JUZGADO (.*?)( \.| $)', content) else ""
-    details['Demandante'] = re.search(r' de (.*?) contra ', content).group(1) if re.search(r' de (.*?) contra ', content) else ""
-    details['Demandado'] = re.search(r' contra (.*?) EXP', content).group(1) if re.search(r' contra (.*?) EXP', content) else ""
+    exp = _search_from(_RE_EXP, content, 'EXP:')
+    details['Expediente'] = exp.group(1) if exp else ""
+    juzgado = _search_from(_RE_JUZGADO, content, 'JUZGADO ')
+    details['Juzgado'] = juzgado.group(1) if juzgado else ""
+    demandante = _RE_DEMANDANTE.search(content) if ' contra ' in content else None
+    details['Demandante'] = demandante.group(1) if demandante else ""
+    demandado = _search_from(_RE_DEMANDADO, content, ' contra ')
+    details['Demandado'] = demandado.group(1) if demandado else ""
 
     return {
         "id": entry['id'],
@@ -241,62 +303,27 @@ def parse_auction_entry(entry):
 # ==========================================
 # 3. HTML GENERATION
 # ==========================================
-
-def formatted_currency(value, currency):
-    symbol = "₡" if currency == "CRC" else "$"
-    return f"{symbol}{value:,.2f}"
-
-def generate_html(parsed_data, output_file):
-    
-    items_html = ""
-    
-    for item in parsed_data:
-        # Determine CSS class
-        css_class = "prop-item" if item['type'] == 'propiedad' else "car-item"
-        badge_class = "bg-prop" if item['type'] == 'propiedad' else "bg-car"
-        badge_text = "Propiedad" if item['type'] == 'propiedad' else "Vehículo"
-        
-        # Price Display (1st auction)
-        main_price = formatted_currency(item['remates'][0]['price'], item['remates'][0]['currency'])
-        
-        # Expediente Info
-        expediente_val = item['details'].get('Expediente', 'No indicado')
-        expediente_html = f'<div class="expediente-info"><strong>EXP:</strong> {expediente_val}</div>'
-        
-        # Remates Cards HTML
-        remates_cards = ""
-        for r in item['remates']:
-            p_fmt = formatted_currency(r['price'], r['currency'])
-            # Clean date formatting slightly
-            d_fmt = r['date'].replace("horas", "").replace("minutos", "").strip()
-            # Capitalize First Letters
-            d_fmt = d_fmt.title() 
-            
-            remates_cards += f"""
+# Per-item fragments, parsed once and filled with str.format for each item.
+_REMATE_TMPL = """
                     <div class="remate-card">
-                        <span class="remate-label">{r['label']}</span>
-                        <span class="remate-price">{p_fmt}</span>
-                        <span class="remate-date">{d_fmt}</span>
+                        <span class="remate-label">{label}</span>
+                        <span class="remate-price">{price}</span>
+                        <span class="remate-date">{date}</span>
                     </div>
             """
-            
-        # Details HTML
-        details_rows = ""
-        for k, v in item['details'].items():
-            if v and len(v) < 200: # Simple filter for length
-                details_rows += f'<div class="detail-row"><span class="detail-key">{k}:</span> <span class="detail-value">{v}</span></div>'
-
-        # Accordion HTML Construction
-        items_html += f"""
-        <!-- ITEM {item['id']} -->
-        <button class="accordion {css_class}" data-type="{item['type']}">
+
+_DETAIL_TMPL = '<div class="detail-row"><span class="detail-key">{key}:</span> <span class="detail-value">{value}</span></div>'
+
+_ITEM_TMPL = """
+        <!-- ITEM {id} -->
+        <button class="accordion {css_class}" data-type="{type}">
             <div class="header-grid">
-                <span class="h-title">{item['title']}</span>
-                <span class="h-area">{item['area']}</span>
+                <span class="h-title">{title}</span>
+                <span class="h-area">{area}</span>
                 <span class="h-price">{main_price}</span>
             </div>
         </button>
-        <div class="panel {item['type']}-panel">
+        <div class="panel {type}-panel">
             <div class="panel-content">
                 <span class="badge {badge_class}">{badge_text}</span>
                 <div class="remates-grid">
@@ -307,23 +334,24 @@ def generate_html(parsed_data, output_file):
                     <div class="section-title">Detalles & Legal</div>
                     {details_rows}
                     <div style="margin-top:10px; font-size: 0.8em; color: #999;">
-                        <em>Texto original extraído: {item['raw'][:100]}...</em>
+                        <em>Texto original extraído: {raw_preview}...</em>
                     </div>
                 </div>
             </div>
         </div>
         """
 
-    # Full HTML Template
-    # reusing the CSS from provided info.html
-    html_template = f"""<!DOCTYPE html>
+# Static page around the items container; generate_html streams the
+# rendered items between the two halves.
+# reusing the CSS from provided info.html
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="es">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Boletín Oficial de Remates - Generado</title>
     <style>
-        :root {{
+        :root {
             --prop-primary: #2c3e50;
             --prop-light: #ecf0f1;
             --car-primary: #d35400;
@@ -332,24 +360,24 @@ def generate_html(parsed_data, output_file):
             --text-muted: #7f8c8d;
             --bg-body: #f4f6f7;
             --card-shadow: 0 2px 5px rgba(0, 0, 0, 0.08);
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Segoe UI', Helvetica, Arial, sans-serif;
             background-color: var(--bg-body);
             color: var(--text-main);
             margin: 0;
             padding: 30px;
             line-height: 1.5;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1000px;
             margin: 0 auto;
-        }}
+        }
         
         /* CONTROLS AREA */
-        .controls {{
+        .controls {
             display: flex;
             justify-content: space-between;
             align-items: center;
@@ -360,9 +388,9 @@ def generate_html(parsed_data, output_file):
             box-shadow: var(--card-shadow);
             flex-wrap: wrap;
             gap: 10px;
-        }}
+        }
         
-        .filter-btn {{
+        .filter-btn {
             padding: 8px 15px;
             border: 1px solid #ddd;
             background: #f8f9fa;
@@ -370,43 +398,43 @@ def generate_html(parsed_data, output_file):
             border-radius: 4px;
             font-weight: 600;
             transition: 0.2s;
-        }}
+        }
         
-        .filter-btn:hover, .filter-btn.active {{
+        .filter-btn:hover, .filter-btn.active {
             background: var(--prop-primary);
             color: white;
             border-color: var(--prop-primary);
-        }}
+        }
 
-        .search-box {{
+        .search-box {
             padding: 8px 12px;
             border: 1px solid #ddd;
             border-radius: 4px;
             width: 250px;
             font-size: 14px;
-        }}
+        }
         
-        .pagination {{
+        .pagination {
             display: flex;
             gap: 5px;
             align-items: center;
-        }}
+        }
         
-        .page-btn {{
+        .page-btn {
             padding: 8px 12px;
             background: white;
             border: 1px solid #ddd;
             cursor: pointer;
             border-radius: 4px;
-        }}
+        }
 
-        .page-btn.active {{
+        .page-btn.active {
             background: var(--prop-primary);
             color: white;
             border-color: var(--prop-primary);
-        }}
+        }
 
-        h1 {{
+        h1 {
             text-align: center;
             color: var(--prop-primary);
             margin-bottom: 30px;
@@ -415,10 +443,10 @@ def generate_html(parsed_data, output_file):
             letter-spacing: 2px;
             border-bottom: 1px solid #ddd;
             padding-bottom: 15px;
-        }}
+        }
 
         /* Estilos del Acordeón (Encabezado) */
-        .accordion {{
+        .accordion {
             background-color: #fff;
             cursor: pointer;
             padding: 15px 20px;
@@ -435,23 +463,23 @@ def generate_html(parsed_data, output_file):
             justify-content: space-between;
             align-items: center;
             border-left: 6px solid transparent;
-        }}
+        }
 
-        .prop-item {{ border-left-color: var(--prop-primary); }}
-        .car-item {{ border-left-color: var(--car-primary); }}
+        .prop-item { border-left-color: var(--prop-primary); }
+        .car-item { border-left-color: var(--car-primary); }
 
-        .accordion:hover, .accordion.active {{ background-color: #fafafa; }}
+        .accordion:hover, .accordion.active { background-color: #fafafa; }
 
         /* Layout del Encabezado */
-        .header-grid {{
+        .header-grid {
             display: grid;
             grid-template-columns: 3fr 1fr 1.2fr;
             width: 100%;
             gap: 15px;
             align-items: center;
-        }}
+        }
 
-        .h-title {{ 
+        .h-title { 
             font-weight: 600; 
             color: #444; 
             font-size: 0.95em;
@@ -460,12 +488,12 @@ def generate_html(parsed_data, output_file):
             overflow: hidden;
             text-overflow: ellipsis;
             display: block;
-        }}
-        .h-area {{ text-align: center; color: var(--text-muted); font-size: 0.9em; }}
-        .h-price {{ text-align: right; font-weight: 700; font-size: 1.1em; color: #27ae60; }}
+        }
+        .h-area { text-align: center; color: var(--text-muted); font-size: 0.9em; }
+        .h-price { text-align: right; font-weight: 700; font-size: 1.1em; color: #27ae60; }
 
         /* Panel de Contenido Desplegable */
-        .panel {{
+        .panel {
             padding: 0 20px;
             background-color: #fff;
             max-height: 0;
@@ -476,17 +504,17 @@ def generate_html(parsed_data, output_file):
             border: 1px solid #eee;
             border-top: none;
             display: none; /* Hidden by default for logic control */
-        }}
+        }
         
-        .panel.show {{
+        .panel.show {
             display: block;
             /* max-height handled by JS */
-        }}
+        }
 
-        .panel-content {{ padding: 25px 0; }}
+        .panel-content { padding: 25px 0; }
 
         /* Etiquetas */
-        .badge {{
+        .badge {
             display: inline-block;
             padding: 5px 10px;
             border-radius: 4px;
@@ -496,29 +524,29 @@ def generate_html(parsed_data, output_file):
             text-transform: uppercase;
             margin-bottom: 15px;
             letter-spacing: 0.5px;
-        }}
-        .bg-prop {{ background-color: var(--prop-primary); }}
-        .bg-car {{ background-color: var(--car-primary); }}
+        }
+        .bg-prop { background-color: var(--prop-primary); }
+        .bg-car { background-color: var(--car-primary); }
 
         /* Tarjetas Remates */
-        .remates-grid {{
+        .remates-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 15px;
             margin-bottom: 25px;
-        }}
-        .remate-card {{
+        }
+        .remate-card {
             background-color: #f8f9fa;
             border: 1px solid #e1e4e8;
             border-radius: 6px;
             padding: 15px;
             text-align: center;
-        }}
-        .remate-label {{ display: block; font-size: 0.75em; color: var(--text-muted); text-transform: uppercase; font-weight: 600; margin-bottom: 5px; }}
-        .remate-price {{ display: block; font-size: 1.1em; font-weight: bold; color: var(--text-main); margin-bottom: 8px; }}
-        .remate-date {{ font-size: 0.85em; color: #555; line-height: 1.3; }}
+        }
+        .remate-label { display: block; font-size: 0.75em; color: var(--text-muted); text-transform: uppercase; font-weight: 600; margin-bottom: 5px; }
+        .remate-price { display: block; font-size: 1.1em; font-weight: bold; color: var(--text-main); margin-bottom: 8px; }
+        .remate-date { font-size: 0.85em; color: #555; line-height: 1.3; }
 
-        .expediente-info {{
+        .expediente-info {
             text-align: center;
             margin-bottom: 20px;
             font-size: 1.1em;
@@ -527,35 +555,35 @@ def generate_html(parsed_data, output_file):
             padding: 10px;
             border-radius: 4px;
             border: 1px dashed #ccc;
-        }}
+        }
 
         /* Detalles */
-        .details-box {{
+        .details-box {
             background-color: #fcfcfc;
             border-left: 3px solid #ddd;
             padding: 15px;
             font-size: 0.9em;
             color: #555;
-        }}
-        .detail-row {{ display: flex; margin-bottom: 6px; border-bottom: 1px solid #eee; padding-bottom: 4px; }}
-        .detail-row:last-child {{ border-bottom: none; }}
-        .detail-key {{ font-weight: 600; width: 130px; flex-shrink: 0; color: var(--prop-primary); }}
-        .detail-value {{ flex-grow: 1; }}
-        .section-title {{
+        }
+        .detail-row { display: flex; margin-bottom: 6px; border-bottom: 1px solid #eee; padding-bottom: 4px; }
+        .detail-row:last-child { border-bottom: none; }
+        .detail-key { font-weight: 600; width: 130px; flex-shrink: 0; color: var(--prop-primary); }
+        .detail-value { flex-grow: 1; }
+        .section-title {
             font-weight: 700; color: var(--prop-primary); margin-bottom: 10px;
             text-transform: uppercase; font-size: 0.8em; letter-spacing: 0.5px;
             border-bottom: 2px solid #eee; padding-bottom: 3px;
-        }}
+        }
         
-        .hidden {{ display: none !important; }}
+        .hidden { display: none !important; }
 
-        @media (max-width: 768px) {{
-            .header-grid {{ grid-template-columns: 1fr; gap: 5px; }}
-            .h-area, .h-price {{ text-align: left; }}
-            .h-price {{ margin-top: 5px; }}
-            .controls {{ flex-direction: column; align-items: stretch; }}
-            .pagination {{ justify-content: center; margin-top: 10px; }}
-        }}
+        @media (max-width: 768px) {
+            .header-grid { grid-template-columns: 1fr; gap: 5px; }
+            .h-area, .h-price { text-align: left; }
+            .h-price { margin-top: 5px; }
+            .controls { flex-direction: column; align-items: stretch; }
+            .pagination { justify-content: center; margin-top: 10px; }
+        }
     </style>
 </head>
 <body>
@@ -578,7 +606,9 @@ def generate_html(parsed_data, output_file):
         </div>
 
         <div id="itemsContainer">
-            {items_html}
+            """
+
+_HTML_TAIL = """
         </div>
     </div>
 
@@ -597,59 +627,59 @@ def generate_html(parsed_data, output_file):
         
         // === LOGIC ===
         
-        function init() {{
+        function init() {
             render();
             setupAccordionListeners();
-        }}
+        }
         
-        function setupAccordionListeners() {{
-            allAccordions.forEach(acc => {{
-                acc.addEventListener("click", function() {{
+        function setupAccordionListeners() {
+            allAccordions.forEach(acc => {
+                acc.addEventListener("click", function() {
                     this.classList.toggle("active");
                     const panel = this.nextElementSibling;
                     
-                    if (panel.style.maxHeight) {{
+                    if (panel.style.maxHeight) {
                         panel.style.maxHeight = null;
                         setTimeout(() => panel.classList.remove('show'), 300); // Wait for transition
-                    }} else {{
+                    } else {
                         panel.classList.add('show');
                         // Use timeout to allow display:block to render before calculating height
-                        setTimeout(() => {{
+                        setTimeout(() => {
                             panel.style.maxHeight = panel.scrollHeight + "px";
-                        }}, 10);
-                    }}
-                }});
-            }});
-        }}
+                        }, 10);
+                    }
+                });
+            });
+        }
 
-        function filterItems(type) {{
+        function filterItems(type) {
             currentFilter = type;
             currentPage = 1;
             
             // Update buttons styling
-            document.querySelectorAll('.filter-btn').forEach(btn => {{
+            document.querySelectorAll('.filter-btn').forEach(btn => {
                 if(btn.innerText.toLowerCase().includes(type == 'all' ? 'todos' : type.substring(0,4))) 
                     btn.classList.add('active');
                 else 
                     btn.classList.remove('active');
-            }});
+            });
             
             render();
-        }}
+        }
         
-        function changePage(page) {{
+        function changePage(page) {
             currentPage = page;
             render();
             // Scroll to top of list
-            document.querySelector('.controls').scrollIntoView({{behavior: 'smooth'}});
-        }}
+            document.querySelector('.controls').scrollIntoView({behavior: 'smooth'});
+        }
 
-        function render() {{
+        function render() {
             // 1. Filter Content
             let visibleItems = [];
             
             // Group items (Button + Panel)
-            for(let i=0; i < allAccordions.length; i++) {{
+            for(let i=0; i < allAccordions.length; i++) {
                 const btn = allAccordions[i];
                 const panel = btn.nextElementSibling;
                 const type = btn.getAttribute('data-type');
@@ -660,14 +690,14 @@ def generate_html(parsed_data, output_file):
                 const contentText = (btn.innerText + " " + panel.innerText).toLowerCase();
                 const matchesSearch = !searchText || contentText.includes(searchText);
 
-                if ((currentFilter === 'all' || type === currentFilter) && matchesSearch) {{
-                    visibleItems.push({{btn, panel}});
-                }} else {{
+                if ((currentFilter === 'all' || type === currentFilter) && matchesSearch) {
+                    visibleItems.push({btn, panel});
+                } else {
                     // Hide completely
                     btn.classList.add('hidden');
                     panel.classList.add('hidden');
-                }}
-            }}
+                }
+            }
             
             // 2. Pagination Logic
             const totalPages = Math.ceil(visibleItems.length / itemsPerPage);
@@ -677,19 +707,19 @@ def generate_html(parsed_data, output_file):
             const endIdx = startIdx + itemsPerPage;
             
             // Show/Hide based on page
-            visibleItems.forEach((item, index) => {{
-                if (index >= startIdx && index < endIdx) {{
+            visibleItems.forEach((item, index) => {
+                if (index >= startIdx && index < endIdx) {
                     item.btn.classList.remove('hidden');
                     // Panel follows button state (collapsed/expanded), but ensure it's not hidden by pag
                     item.panel.classList.remove('hidden'); 
                     // However, we only show panel content if active. 
                     // This creates a conflict if we used 'hidden' for both filtering and pagination.
                     // Let's rely on 'hidden' for filtering AND pagination filtering.
-                }} else {{
+                } else {
                     item.btn.classList.add('hidden');
                     item.panel.classList.add('hidden');
-                }}
-            }});
+                }
+            });
             
             // 3. Render Pagination Controls
             const pagContainer = document.getElementById('paginationControls');
@@ -708,17 +738,17 @@ def generate_html(parsed_data, output_file):
             let startPage = Math.max(1, currentPage - 2);
             let endPage = Math.min(totalPages, startPage + 4);
             
-            if (endPage - startPage < 4) {{
+            if (endPage - startPage < 4) {
                 startPage = Math.max(1, endPage - 4);
-            }}
+            }
             
-            for(let i=startPage; i<=endPage; i++) {{
+            for(let i=startPage; i<=endPage; i++) {
                 const btn = document.createElement('button');
                 btn.innerText = i;
-                btn.className = `page-btn ${{i === currentPage ? 'active' : ''}}`;
+                btn.className = `page-btn ${i === currentPage ? 'active' : ''}`;
                 btn.onclick = () => changePage(i);
                 pagContainer.appendChild(btn);
-            }}
+            }
             
             // Next
             const nextBtn = document.createElement('button');
@@ -732,9 +762,9 @@ def generate_html(parsed_data, output_file):
             const info = document.createElement('span');
             info.style.marginLeft = '10px';
             info.style.fontSize = '0.9em';
-            info.innerText = `Pág ${{currentPage}} de ${{totalPages || 1}}`;
+            info.innerText = `Pág ${currentPage} de ${totalPages || 1}`;
             pagContainer.appendChild(info);
-        }}
+        }
         
         // Start
         init();
@@ -743,9 +773,66 @@ def generate_html(parsed_data, output_file):
 </body>
 </html>
 """
+
+def formatted_currency(value, currency):
+    return f"{'₡' if currency == 'CRC' else '$'}{value:,.2f}"
+
+def generate_html(parsed_data, output_file):
     
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_template)
+        f.write(_HTML_HEAD)
+        for item in parsed_data:
+            # Determine CSS class
+            css_class = "prop-item" if item['type'] == 'propiedad' else "car-item"
+            badge_class = "bg-prop" if item['type'] == 'propiedad' else "bg-car"
+            badge_text = "Propiedad" if item['type'] == 'propiedad' else "Vehículo"
+        
+            # All remates of an item share its currency: format each price
+            # once, the 1st auction doubling as header
+            currency = item['remates'][0]['currency']
+            prices = [formatted_currency(r['price'], currency) for r in item['remates']]
+            
+            # Price Display (1st auction)
+            main_price = prices[0]
+        
+            # Expediente Info
+            expediente_val = item['details'].get('Expediente', 'No indicado')
+            expediente_html = f'<div class="expediente-info"><strong>EXP:</strong> {expediente_val}</div>'
+        
+            # Remates Cards HTML
+            remates_parts = []
+            for r, p_fmt in zip(item['remates'], prices):
+                # Clean date formatting slightly
+                d_fmt = r['date'].replace("horas", "").replace("minutos", "").strip()
+                # Capitalize First Letters
+                d_fmt = d_fmt.title() 
+            
+                remates_parts.append(_REMATE_TMPL.format(label=r['label'], price=p_fmt, date=d_fmt))
+            remates_cards = "".join(remates_parts)
+            
+            # Details HTML
+            details_parts = []
+            for k, v in item['details'].items():
+                if v and len(v) < 200: # Simple filter for length
+                    details_parts.append(_DETAIL_TMPL.format(key=k, value=v))
+            details_rows = "".join(details_parts)
+
+            # Accordion HTML Construction
+            f.write(_ITEM_TMPL.format(
+                id=item['id'],
+                type=item['type'],
+                title=item['title'],
+                area=item['area'],
+                css_class=css_class,
+                badge_class=badge_class,
+                badge_text=badge_text,
+                main_price=main_price,
+                remates_cards=remates_cards,
+                expediente_html=expediente_html,
+                details_rows=details_rows,
+                raw_preview=item['raw'][:100],
+            ))
+        f.write(_HTML_TAIL)
     
     print(f"Generado exitosamente: {output_file}")
 
@@ -753,9 +840,14 @@ def generate_html(parsed_data, output_file):
 # ==========================================
 # MAIN EXECUTION
 # ==========================================
+# Below this many entries (or on a single core) starting worker processes
+# costs more than parsing the entries serially
+_MIN_PARALLEL_ENTRIES = 1000
+
 if __name__ == "__main__":
     # Find JSON files in current directory
-    json_files = glob.glob("*.json")
+    json_files = [e.name for e in os.scandir('.')
+                  if e.name.endswith('.json') and not e.name.startswith('.') and e.is_file()]
     
     if not json_files:
         print("Error: No se encontraron archivos JSON en el directorio actual.")
@@ -771,11 +863,18 @@ if __name__ == "__main__":
         
         print(f"Leyendo {input_json}...")
         try:
-            with open(input_json, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(input_json, 'rb') as f:
+                data = _json_loads(f.read())
                 
             print(f"Procesando {len(data)} entradas...")
-            parsed_items = [parse_auction_entry(item) for item in data]
+            cpus = os.cpu_count() or 1
+            if len(data) < _MIN_PARALLEL_ENTRIES or cpus < 2:
+                parsed_items = [parse_auction_entry(entry) for entry in data]
+            else:
+                # Entries are independent, so parse them across all cores
+                chunksize = max(1, len(data) // (cpus * 4))
+                with ProcessPoolExecutor() as executor:
+                    parsed_items = list(executor.map(parse_auction_entry, data, chunksize=chunksize))
             
             print("Generando HTML...")
             generate_html(parsed_items, output_html)
@@ -1,8 +1,176 @@
 import re
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pypdf import PdfReader
 
+try:
+    # orjson codifica las cadenas varias veces más rápido que json y, igual
+    # que json.dumps(..., ensure_ascii=False), deja los acentos sin escapar
+    from orjson import dumps as _orjson_dumps
+
+    def _cadena_json(texto):
+        return _orjson_dumps(texto).decode("utf-8")
+except ImportError:
+    def _cadena_json(texto):
+        return json.dumps(texto, ensure_ascii=False)
+
+# Patrón de búsqueda - MÁS FLEXIBLE, compilado una sola vez
+# Mejoras en el patrón:
+# - Coma opcional después de "Despacho"
+# - Acepta variaciones de acentos (ó/o, ú/u) comunes en OCR
+# - Dos puntos opcionales después de "número"
+# - Espacios flexibles
+# - Hueco acotado a 20000 caracteres (muy por encima del edicto más largo),
+#   para que un edicto sin "publicación número" no retroceda sobre todo el texto
+# - En minúsculas: se busca sobre el texto ya pasado a minúsculas, sin
+#   re.IGNORECASE, que obliga a plegar mayúsculas en cada carácter probado
+_DESPACHO_RE = re.compile(
+    r"en este despacho[,\s]+.{0,20000}?publicaci[óo]n n[úu]mero\s*:?\s*\d+\s+de\s+\d+"
+)
+
+# Largo máximo que se conserva del texto pendiente entre páginas: cubre el
+# hueco acotado del patrón (20000) más el encabezado y el cierre del edicto
+_MAX_EDICTO = 25000
+
+# Literales con que abre y cierra todo edicto, en minúsculas. Se buscan con
+# str.find antes de correr la expresión regular completa
+_ANCLA_INICIO = "en este despacho"
+_ANCLA_CIERRE = "publicaci"
+
+# Un registro del JSON de salida, ya sangrado como elemento de la lista con
+# el formato de json.dump(..., indent=4). orjson sólo sangra con 2 espacios,
+# así que se le pide únicamente el contenido como cadena JSON
+_REGISTRO_JSON = '{{\n        "id": {},\n        "contenido": {}\n    }}'
+
+# Por debajo de estas páginas no vale la pena levantar procesos
+_MIN_PAGINAS_PARALELO = 8
+
+def _minusculas(texto):
+    """
+    Pasa el texto a minúsculas conservando el largo, para que las posiciones
+    de un match sirvan también sobre el texto original. "İ" es el único
+    carácter cuya minúscula ocupa dos.
+    """
+    return texto.replace("İ", "I").lower()
+
+def _texto_de_pagina(page):
+    """
+    Devuelve el texto de una página normalizado a una sola línea.
+    """
+    # El modo normal es varias veces más rápido que el modo layout, que
+    # reconstruye la disposición de la página sólo para que luego se
+    # descarten los espacios
+    text = page.extract_text()
+    if not text:
+        return ""
+    # Normalizar espacios (eliminar cortes de línea arbitrarios del PDF)
+    # split() sin argumentos separa por cualquier secuencia de
+    # espacios o saltos de línea, así que ya normaliza el texto. Las
+    # mismas palabras sirven para medir si vienen pegadas
+    palabras = text.split()
+    if len(palabras) < 0.1 * len(text):
+        # Palabras pegadas (más de 10 caracteres por palabra en promedio):
+        # repetir con modo layout para mejor preservación de espacios,
+        # similar a como lo hace PdfParserService.cs con GetWords()
+        palabras = page.extract_text(extraction_mode="layout").split()
+    return " ".join(palabras)
+
+# Lectores abiertos por cada proceso del pool, por ruta del PDF, para no
+# volver a leer el archivo y su tabla de referencias cruzadas en cada página.
+# Sólo lo llenan los trabajadores: el proceso principal usa su propio lector
+_lectores = {}
+
+def _extraer_pagina(args):
+    """
+    Trabajador del pool: extrae una página con el lector de su proceso,
+    abriendo el PDF sólo la primera vez.
+    """
+    pdf_path, indice = args
+    reader = _lectores.get(pdf_path)
+    if reader is None:
+        reader = _lectores[pdf_path] = PdfReader(pdf_path, strict=False)
+    return _texto_de_pagina(reader.pages[indice])
+
+def _textos_de_paginas(reader, pdf_path):
+    """
+    Devuelve, página por página y en orden, el texto normalizado a una sola
+    línea. La extracción de pypdf es CPU puro e independiente por página, así
+    que con suficientes páginas y núcleos se reparte en un pool de procesos.
+    """
+    num_paginas = len(reader.pages)
+    if num_paginas < _MIN_PAGINAS_PARALELO or (os.cpu_count() or 1) < 2:
+        textos = (_texto_de_pagina(page) for page in reader.pages)
+        yield from (text for text in textos if text)
+        return
+    
+    with ProcessPoolExecutor() as executor:
+        tareas = [(pdf_path, i) for i in range(num_paginas)]
+        # map() entrega los resultados en el orden de las páginas
+        for text in executor.map(_extraer_pagina, tareas):
+            if text:
+                yield text
+
+def _buscar_parrafos(textos):
+    """
+    Busca los párrafos sobre una ventana móvil de texto: lo que queda sin
+    consumir de las páginas anteriores más la página actual. Cada párrafo se
+    devuelve en cuanto está completo, sin juntar el documento entero.
+    """
+    pendiente = ""
+    for texto in textos:
+        pendiente = f"{pendiente} {texto}" if pendiente else texto
+        minusculas = _minusculas(pendiente)
+        inicio = minusculas.find(_ANCLA_INICIO)
+        if inicio < 0:
+            # Sin apertura no hay edicto: basta conservar la cola por si
+            # la apertura quedó cortada entre dos páginas
+            pendiente = pendiente[-len(_ANCLA_INICIO):]
+            continue
+        if minusculas.find(_ANCLA_CIERRE, inicio) < 0:
+            # El edicto todavía no cierra: esperar la página siguiente
+            pendiente = pendiente[inicio:][-_MAX_EDICTO:]
+            continue
+        fin = inicio
+        # Se busca en minúsculas y se recorta el texto original, que
+        # conserva las mayúsculas
+        for match in _DESPACHO_RE.finditer(minusculas, inicio):
+            # Si toca el final, la página siguiente todavía podría alargarlo
+            if match.end() == len(minusculas):
+                break
+            yield pendiente[match.start():match.end()].strip()
+            fin = match.end()
+        pendiente = pendiente[fin:][-_MAX_EDICTO:]
+    
+    for match in _DESPACHO_RE.finditer(_minusculas(pendiente)):
+        yield pendiente[match.start():match.end()].strip()
+
+def _guardar_json(parrafos, json_output_path):
+    """
+    Escribe los párrafos registro por registro, con el mismo formato que
+    json.dump(data, f, ensure_ascii=False, indent=4). Devuelve la cantidad.
+    
+    Como las páginas se extraen mientras se escribe, se escribe a un archivo
+    temporal en la misma carpeta que sólo reemplaza al JSON de salida al
+    terminar: si una página falla, el JSON anterior queda intacto.
+    """
+    temporal = f"{json_output_path}.tmp"
+    total = 0
+    try:
+        with open(temporal, 'w', encoding='utf-8') as f:
+            f.write("[")
+            for total, contenido in enumerate(parrafos, 1):
+                registro = _REGISTRO_JSON.format(total, _cadena_json(contenido))
+                f.write(("\n    " if total == 1 else ",\n    ") + registro)
+            f.write("\n]" if total else "]")
+        os.replace(temporal, json_output_path)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+    return total
+
 def extraer_parrafos_despacho(pdf_path, json_output_path):
     """
     Extrae los párrafos que inician con 'En este Despacho' de un Boletín Judicial
@@ -11,55 +179,25 @@ def extraer_parrafos_despacho(pdf_path, json_output_path):
     Mejoras:
     - Extracción de texto con mejor separación de palabras
     - Patrón regex flexible para manejar variaciones de formato y OCR
+    - Procesa página por página: memoria acotada a unas dos páginas
     """
     print(f"Leyendo archivo: {pdf_path}...")
     
     try:
         reader = PdfReader(pdf_path)
-        full_text = ""
-        
-        # 1. Extraer texto de todas las páginas con mejor separación
-        # Similar a como lo hace PdfParserService.cs con GetWords()
-        for page in reader.pages:
-            # Extraer con modo layout para mejor preservación de espacios
-            text = page.extract_text(extraction_mode="layout")
-            if text:
-                # Asegurar que hay espacios entre palabras
-                # Normalizar múltiples espacios a uno solo
-                text = re.sub(r' +', ' ', text)
-                full_text += text + "\n"
-        
-        # 2. Normalizar espacios (eliminar cortes de línea arbitrarios del PDF)
-        # Esto convierte el texto en una sola línea continua para facilitar la búsqueda
-        clean_text = re.sub(r'\s+', ' ', full_text)
         
-        # 3. Definir el patrón de búsqueda - MÁS FLEXIBLE
-        # Mejoras en el patrón:
-        # - Coma opcional después de "Despacho"
-        # - Acepta variaciones de acentos (ó/o, ú/u) comunes en OCR
-        # - Dos puntos opcionales después de "número"
-        # - Espacios flexibles
-        patron = r"En este Despacho[,\s]+.*?publicaci[óo]n n[úu]mero\s*:?\s*\d+\s+de\s+\d+"
+        # 1. Extraer el texto de cada página, 2. buscar los párrafos y
+        # 3. guardarlos en JSON, todo en flujo a medida que se leen las páginas
+        parrafos = _buscar_parrafos(_textos_de_paginas(reader, pdf_path))
+        total = _guardar_json(parrafos, json_output_path)
         
-        matches = re.findall(patron, clean_text, re.IGNORECASE)
-        
-        print(f"Se encontraron {len(matches)} párrafos.")
-        
-        # 4. Estructurar datos para JSON
-        data = [{"id": i+1, "contenido": match.strip()} for i, match in enumerate(matches)]
-        
-        # 5. Guardar en JSON
-        with open(json_output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-            
+        print(f"Se encontraron {total} párrafos.")
         print(f"Datos guardados exitosamente en: {json_output_path}")
 
     except Exception as e:
         print(f"Error al procesar el archivo: {e}")
 
 if __name__ == "__main__":
-    import os
-    
     # Obtener el directorio donde se encuentra el script
     script_dir = os.path.dirname(os.path.abspath(__file__))
     